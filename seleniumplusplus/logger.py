@@ -1,7 +1,9 @@
+import atexit
 import logging
 import logging.handlers
 import os
-from typing import Optional, Union
+import sys
+from typing import Any, Optional, Union
 from pathlib import Path
 
 """
@@ -24,18 +26,83 @@ error("Something went wrong", exc_info=True)
 # Adjust log level as needed
 set_log_level("DEBUG") """
 
+class ThrottledRotatingFileHandler(logging.handlers.RotatingFileHandler):
+    """
+    RotatingFileHandler that only checks for rollover once every `check_bytes`
+    written, instead of seeking/stat-ing the log file on every record.
+    A log file may therefore exceed maxBytes by up to `check_bytes` before rotating.
+
+    :param check_bytes: Bytes to write between two rollover checks (default: 64KB)
+    """
+
+    def __init__(self, *args: Any, check_bytes: int = 65_536, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.check_bytes = check_bytes
+        self._unchecked_bytes = 0
+
+    def shouldRollover(self, record: logging.LogRecord) -> bool:
+        if self._unchecked_bytes < self.check_bytes:
+            return False
+        self._unchecked_bytes = 0
+        return bool(super().shouldRollover(record))
+
+    def emit(self, record: logging.LogRecord) -> None:
+        # Same steps as RotatingFileHandler.emit, but formatting the record once for
+        # both the write and the byte count (super().shouldRollover formats it again,
+        # only once per check_bytes)
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            msg = self.format(record) + self.terminator
+            self.stream.write(msg)
+            self.flush()
+            self._unchecked_bytes += (
+                len(msg) if msg.isascii()
+                else len(msg.encode(self.encoding or 'utf-8', self.errors or 'strict'))
+            )
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+
+def _handle_exception(exc_type, exc_value, exc_traceback) -> None:
+    """Handle uncaught exceptions by logging them"""
+    if issubclass(exc_type, KeyboardInterrupt):
+        # Call the default handler for KeyboardInterrupt
+        sys.__excepthook__(exc_type, exc_value, exc_traceback)
+        return
+    logger.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
+
+
+# Names of the loggers whose handlers are flushed at exit, so setup_logger registers
+# the atexit hook once per logger however often it is called
+_flushed_at_exit: set = set()
+
+
+def _flush_handlers(name: str) -> None:
+    """Flushes whatever handlers the named logger has when the interpreter exits."""
+    for handler in logging.getLogger(name).handlers:
+        handler.flush()
 
 
 def setup_logger(
     log_file: str = 'test.log',
     level: int = logging.INFO,
-    max_bytes: int = 5_000_000,  # 5MB
+    max_bytes: int = 50_000_000,  # 50MB
     backup_count: int = 3,
     log_format: Optional[str] = None,
-    log_dir: Optional[str] = None
+    log_dir: Optional[str] = None,
+    buffer_capacity: int = 1000,
+    name: str = 'seleniumplusplus',
+    skip_process_info: bool = False
 ) -> logging.Logger:
     """
     Configure and return a logger with both console and rotating file handlers.
+    The logger doesn't propagate to the root logger, so records from other libraries
+    (selenium, urllib3, ...) don't end up in the log file.
     
     :param log_file: Name of the log file
     :param level: Logging level (default: INFO)
@@ -43,12 +110,31 @@ def setup_logger(
     :param backup_count: Number of backup files to keep
     :param log_format: Custom log format string
     :param log_dir: Directory for log files (default: current directory)
+    :param buffer_capacity: Number of records buffered before writing to the log file
+                            (records of level ERROR and above are flushed immediately)
+    :param name: Name of the logger to configure (default: the package logger)
+    :param skip_process_info: Stop collecting thread/process info in every LogRecord
+                              (see "Optimization" in the logging HOWTO). This applies to
+                              every logger of the process, so only enable it when no
+                              format uses %(thread)s, %(process)s, ... fields
     :return: Configured logger instance
     """
-    logger = logging.getLogger()
+    if skip_process_info:
+        logging.logThreads = False
+        logging.logProcesses = False
+        logging.logMultiprocessing = False
+
+    logger = logging.getLogger(name)
     logger.setLevel(level)
+    logger.propagate = False
 
-    # Clear any existing handlers
+    # Keep third-party chatter out of the console and log file
+    for noisy_logger in ('selenium', 'urllib3'):
+        logging.getLogger(noisy_logger).setLevel(logging.WARNING)
+
+    # Clear any existing handlers, flushing buffered records first
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
 
     # Create log directory if specified
@@ -69,7 +155,7 @@ def setup_logger(
     logger.addHandler(console_handler)
 
     # Rotating file handler (detailed format for debugging)
-    file_handler = logging.handlers.RotatingFileHandler(
+    file_handler = ThrottledRotatingFileHandler(
         log_file,
         mode='a',
         maxBytes=max_bytes,
@@ -77,27 +163,28 @@ def setup_logger(
         encoding='utf-8'
     )
     file_handler.setFormatter(detailed_formatter)
-    logger.addHandler(file_handler)
 
-    def handle_exception(exc_type, exc_value, exc_traceback):
-        """Handle uncaught exceptions by logging them"""
-        if issubclass(exc_type, KeyboardInterrupt):
-            # Call the default handler for KeyboardInterrupt
-            sys.__excepthook__(exc_type, exc_value, exc_traceback)
-            return
-        logger.critical("Uncaught exception", exc_info=(exc_type, exc_value, exc_traceback))
+    # Buffer file writes so each record doesn't cost a write() and rollover check
+    memory_handler = logging.handlers.MemoryHandler(
+        capacity=buffer_capacity,
+        flushLevel=logging.ERROR,
+        target=file_handler,
+        flushOnClose=True
+    )
+    logger.addHandler(memory_handler)
+    if name not in _flushed_at_exit:
+        _flushed_at_exit.add(name)
+        atexit.register(_flush_handlers, name)
 
     # Set the exception hook
-    import sys
-    sys.excepthook = handle_exception
+    sys.excepthook = _handle_exception
 
     return logger
 
-# Initialize default logger
-logger = setup_logger()
-
-# Override print for legacy compatibility
-print = logger.info
+# Initialize default logger, unless the application already configured logging
+logger = logging.getLogger('seleniumplusplus')
+if not logger.handlers and not logging.getLogger().handlers:
+    logger = setup_logger()
 
 # Export commonly used logging functions
 debug = logger.debug
@@ -1,29 +1,56 @@
-# driver_initializer.py
-from typing import Any, Optional, Dict, Tuple, Union
+# selenium_initializer.py
+from typing import Any, Optional, Dict, Iterable, Iterator, List, Union
 from selenium import webdriver
 from selenium.webdriver.chrome.options import Options
-from selenium.webdriver.chrome.webdriver import WebDriver
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.support.wait import WebDriverWait
 import logging
-import time
 from dotenv import load_dotenv
 import os
+import sys
+import codecs
+import functools
 import csv
+import io
+import itertools
 import json
 from pathlib import Path
-from typing import List, Dict, Any, Union
+
+try:
+    import orjson  # Optional: much faster JSON (de)serialization
+except ImportError:
+    orjson = None
+
+try:
+    import simdjson  # Optional: lazy JSON documents for sparse access
+except ImportError:
+    simdjson = None
+
+try:
+    import ijson  # Optional: streaming JSON array parsing
+except ImportError:
+    ijson = None
 
 logger = logging.getLogger(__name__)
 
+
+def _use_orjson(encoding: str) -> bool:
+    """orjson only reads and writes UTF-8, fall back to stdlib json for anything else."""
+    return orjson is not None and encoding.lower().replace("_", "-") in ("utf-8", "utf8")
+
 def init_driver(url: str, 
                 headless: bool = False,
-                custom_options: Optional[Dict[str, Any]] = None) -> WebDriver:
+                custom_options: Optional[Dict[str, Any]] = None,
+                load_timeout: int = 10,
+                poll_frequency: float = 0.15) -> WebDriver:
     """
     Enhanced driver initialization with more options
     
     :param url: The URL to navigate to
     :param headless: Whether to run in headless mode
     :param custom_options: Dictionary of additional Chrome options
+    :param load_timeout: Max seconds to wait for the page to finish loading
+    :param poll_frequency: Seconds between two readyState checks
     :return: Initialized WebDriver
     """
     opt = Options()
@@ -39,16 +66,32 @@ def init_driver(url: str,
         for exp in custom_options.get('experimental_options', {}):
             opt.add_experimental_option(exp['name'], exp['value'])
 
+    driver = None
     try:
-        driver = webdriver.Chrome(options=opt)
+        # keep_alive reuses the HTTP connection to chromedriver for every command
+        driver = webdriver.Chrome(options=opt, keep_alive=True)
         driver.maximize_window()
         driver.get(url)
-        time.sleep(2)  # Consider replacing with explicit wait
+        WebDriverWait(driver, load_timeout, poll_frequency=poll_frequency).until(
+            lambda d: d.execute_script("return document.readyState") == "complete"
+        )
         return driver
     except Exception as e:
-        logger.error(f"Failed to initialize driver: {str(e)}")
+        logger.error("Failed to initialize driver: %s", e)
+        # Don't leak the chromedriver process and browser of a half-started session
+        if driver is not None:
+            try:
+                driver.quit()
+            except Exception:
+                logger.debug("Failed to quit the driver", exc_info=True)
         raise
 
+@functools.lru_cache(maxsize=1)
+def _load_env_once() -> bool:
+    """Loads the .env file into the environment only on the first call."""
+    return load_dotenv()
+
+
 def read_login_env(username_id, password_id) -> tuple[str | None, str | None]:
     """
     Reads environment variables for username and password IDs.
@@ -57,10 +100,35 @@ def read_login_env(username_id, password_id) -> tuple[str | None, str | None]:
         username_id (str): The environment variable for the username for example: "LOGIN_NAME".
         password_id (str): The environment variable for the password for example: "PASSWORD".
     """
-    load_dotenv()
+    _load_env_once()
     return os.getenv(username_id), os.getenv(password_id)
 
 
+def iter_csv(path, delimiter = ";", encoding = "utf-8-sig") -> Iterator[Dict[str, str]]:
+    '''
+    Lazily yields the rows of a CSV file as dictionaries, one at a time.
+    Unlike read_csv, errors are raised to the caller instead of being logged.
+
+    Args:
+    - path (str): The path to the CSV file.
+    - delimiter (str): The delimiter used in the CSV file (default is ";").
+    - encoding (str): The encoding of the CSV file (default is "utf-8-sig").
+
+    Yields:
+    - dict: One row of the CSV file.
+    '''
+    with open(file=path, mode="rb") as rawfile:
+        if encoding.lower().replace("_", "-") in ("utf-8-sig", "utf8-sig"):
+            # Only the first 3 bytes can hold a BOM: skip it and decode the rest as plain utf-8
+            if rawfile.read(len(codecs.BOM_UTF8)) != codecs.BOM_UTF8:
+                rawfile.seek(0)
+            encoding = "utf-8"
+
+        # Stream rows straight from the file
+        with io.TextIOWrapper(rawfile, encoding=encoding, newline="") as csvfile:
+            yield from csv.DictReader(csvfile, delimiter=delimiter)
+
+
 def read_csv(path, delimiter = ";", encoding = "utf-8-sig") -> list:
     '''
     Reads a CSV file and returns its content as a list of dictionaries.
@@ -75,23 +143,11 @@ def read_csv(path, delimiter = ";", encoding = "utf-8-sig") -> list:
     '''
     data = []
     try:
-        with open(file=path, mode="rb") as csvfile:
-            content = csvfile.read().decode(encoding=encoding)  # Remove BOM if present
-            csvreader = csv.DictReader(content.splitlines(), delimiter=delimiter)
-
-            # Iterate through each row in the CSV
-            for row in csvreader:
-                # Append each row (as a dictionary) to the data list
-                data.append(row)
-
+        data = list(iter_csv(path, delimiter, encoding))
     except FileNotFoundError:
-        # Print the current working directory
-        print("Current working directory:", os.getcwd())
-        print(f"File not found at path: {os.getcwd()}{path}")
-        print("File not found.")
-    except Exception as e:
-        print("Error reading CSV file.")
-        print(e)
+        logger.error("File not found at path: %s (cwd: %s)", path, os.getcwd())
+    except Exception:
+        logger.exception("Error reading CSV file: %s", path)
 
     return data
 
@@ -101,36 +157,45 @@ def safe_file_operation(func):
         try:
             return func(*args, **kwargs)
         except FileNotFoundError as e:
-            logger.error(f"File not found: {str(e)}")
+            logger.error("File not found: %s", e)
             raise
         except PermissionError as e:
-            logger.error(f"Permission denied: {str(e)}")
+            logger.error("Permission denied: %s", e)
             raise
         except Exception as e:
-            logger.error(f"Operation failed: {str(e)}")
+            logger.error("Operation failed: %s", e)
             raise
     return wrapper
 
 @safe_file_operation
 def save_csv(path: Union[str, Path], 
-             data: List[Dict], 
+             data: Iterable[Dict], 
              fieldnames: Optional[List[str]] = None,
              delimiter: str = ";", 
              encoding: str = "utf-8") -> bool:
-    """Enhanced CSV saving with better path handling and validation"""
+    """
+    Enhanced CSV saving with better path handling and validation.
+    data may be any iterable of rows (e.g. iter_csv), it is written without being materialized;
+    fieldnames default to the keys of the first row.
+    """
     path = Path(path)
     path.parent.mkdir(parents=True, exist_ok=True)
-    
-    if not data:
+
+    # Peek the first row instead of indexing, so generators stream straight through
+    rows = iter(data)
+    first_row = next(rows, None)
+    if first_row is None:
         raise ValueError("No data provided to save")
-        
-    fieldnames = fieldnames or list(data[0].keys())
+
+    fieldnames = fieldnames or tuple(first_row)
+    rows = itertools.chain((first_row,), rows)
     
-    with path.open("w", newline="", encoding=encoding) as csvfile:
-        writer = csv.DictWriter(csvfile, fieldnames=fieldnames, delimiter=delimiter)
-        writer.writeheader()
-        writer.writerows(data)
-        logger.info(f"Successfully saved CSV to {path}")
+    # Large write buffer + plain csv.writer rows avoid DictWriter's per-row dict handling
+    with path.open("w", newline="", encoding=encoding, buffering=1 << 20) as csvfile:
+        writer = csv.writer(csvfile, delimiter=delimiter)
+        writer.writerow(fieldnames)
+        writer.writerows([row.get(key, "") for key in fieldnames] for row in rows)
+        logger.info("Successfully saved CSV to %s", path)
         return True
 
 def read_json(path, encoding='utf-8') -> Any | list:
@@ -147,20 +212,78 @@ def read_json(path, encoding='utf-8') -> Any | list:
     """
     data = []
     try:
-        with open(path, "r", encoding=encoding) as jsonfile:
-            data = json.load(jsonfile)
+        if _use_orjson(encoding):
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path, "r", encoding=encoding) as jsonfile:
+                data = json.load(jsonfile)
     except FileNotFoundError:
-        print(f"File not found at path: {path}")
-    except Exception as e:
-        print("Error reading JSON file.")
-        print(e)
+        logger.error("File not found at path: %s", path)
+    except Exception:
+        logger.exception("Error reading JSON file: %s", path)
 
     return data
 
 
+def read_json_lazy(path) -> Any:
+    """
+    Parses a JSON file into a lazy simdjson document instead of a full Python object tree.
+
+    Indexing into the returned proxy (e.g. doc["items"][0]["name"]) only converts the
+    accessed values, so this is the cheaper choice for large files of which only a few
+    fields are used. Call .as_dict() / .as_list() on a proxy to materialize it.
+    Falls back to read_json when pysimdjson is not installed.
+
+    Args:
+        path (str): The path to the JSON file (must be UTF-8 encoded).
+
+    Returns:
+        simdjson.Object | simdjson.Array | Any: The parsed document.
+    """
+    if simdjson is None:
+        logger.debug("pysimdjson not installed, falling back to read_json")
+        return read_json(path)
+
+    # Each document stays bound to its parser, so don't share one between calls
+    parser = simdjson.Parser()
+    return parser.parse(Path(path).read_bytes())
+
+
+def iter_json_array(path, encoding='utf-8') -> Iterator[Any]:
+    """
+    Lazily yields the items of a top-level JSON array without building the whole list.
+    Yields nothing when the top level is not an array.
+    Streams with ijson when installed, otherwise parses the file with read_json's backend.
+    Unlike read_json, errors are raised to the caller instead of being logged.
+
+    Args:
+        path (str): The path to the JSON file.
+
+    Yields:
+        Any: One item of the JSON array.
+    """
+    if ijson is None:
+        if _use_orjson(encoding):
+            data = orjson.loads(Path(path).read_bytes())
+        else:
+            with open(path, "r", encoding=encoding) as jsonfile:
+                data = json.load(jsonfile)
+        # Like ijson's "item" prefix, a top-level object or scalar has no array items
+        if isinstance(data, list):
+            yield from data
+        return
+
+    # ijson works on the raw bytes and detects the UTF encoding itself
+    with open(path, "rb") as jsonfile:
+        yield from ijson.items(jsonfile, "item")
+
+
 def save_json(path, data, encoding='utf-8') -> bool:
     """
     Saves the data to a JSON file at the specified path.
+    With the optional orjson installed (UTF-8 only), the file is indented by 2 spaces,
+    keeps non-ASCII text as-is and has NaN/Infinity written as null; the stdlib
+    fallback indents by 4, escapes non-ASCII and writes NaN/Infinity literally.
 
     Args:
         path (str): The path to the JSON file.
@@ -171,20 +294,30 @@ def save_json(path, data, encoding='utf-8') -> bool:
     """
     # Save the updated data back to the JSON file
     try:
-        with open(path, "w", encoding=encoding) as jsonfile:
-            json.dump(data, jsonfile, indent=4)
-            print("Data saved successfully.")
-    except Exception as e:
-        print(f"Error writing to JSON file: {e}")
+        if _use_orjson(encoding):
+            Path(path).write_bytes(
+                orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+            )
+        else:
+            with open(path, "w", encoding=encoding) as jsonfile:
+                json.dump(data, jsonfile, indent=4)
+        logger.info("Data saved successfully to %s", path)
+    except Exception:
+        logger.exception("Error writing to JSON file: %s", path)
         return False
     
     return True
 
 
+@functools.lru_cache(maxsize=1)
+def _enable_windows_vt_once() -> None:
+    """Turns on ANSI escape sequence processing in Windows 10+ consoles, once per process."""
+    os.system("")
+
+
 def clear_console() -> None:
-    # For Windows
+    # Write the ANSI clear sequence directly instead of spawning cls/clear each time
     if os.name == "nt":
-        os.system("cls")
-    # For Mac and Linux (os.name is 'posix')
-    else:
-        os.system("clear")
\ No newline at end of file
+        _enable_windows_vt_once()
+    sys.stdout.write("\x1b[H\x1b[2J\x1b[3J")
+    sys.stdout.flush()
\ No newline at end of file
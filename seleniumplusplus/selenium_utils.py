@@ -1,7 +1,6 @@
 from selenium import webdriver
 from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support.wait import WebDriverWait
-from selenium.webdriver.support.select import Select
 from selenium.webdriver.common.by import By
 from selenium.webdriver.support import expected_conditions as EC
 from selenium.common.exceptions import (
@@ -10,15 +9,281 @@ from selenium.common.exceptions import (
     NoSuchElementException,
     ElementNotVisibleException,
     StaleElementReferenceException,
+    JavascriptException,
 )
 from selenium.webdriver.remote.webelement import WebElement
 from selenium.webdriver.common.action_chains import ActionChains
-from typing import Optional, List, Literal, Union
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Final,
+    Iterable,
+    Iterator,
+    Optional,
+    List,
+    Literal,
+    Tuple,
+    Union,
+    get_args,
+)
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+import contextlib
+import functools
 import logging
+import re
+import threading
+import time
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
+# Library module: leave configuring logging to the application. Records propagate to
+# the 'seleniumplusplus' logger (see .logger.setup_logger), and the NullHandler keeps
+# them silent (instead of hitting logging's lastResort) when nothing is configured.
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+# Locator method names accepted by the helpers' `by` parameters
+ByName = Literal[
+    "id",
+    "xpath",
+    "link_text",
+    "partial_link_text",
+    "name",
+    "tag_name",
+    "class_name",
+    "css_selector",
+]
+
+# A resolved (By.* strategy, locator value) pair, reusable across calls
+Locator = Tuple[str, str]
+
+# What SeleniumUtils.find_element waits for before returning an element
+FindCondition = Literal["presence", "visibility", "clickable"]
+
+# Condition name -> (locator based expected condition to wait on,
+#                    element based one to check an already probed element with)
+_FIND_CONDITIONS = {
+    "presence": (EC.presence_of_element_located, None),
+    "visibility": (EC.visibility_of_element_located, EC.visibility_of),
+    "clickable": (EC.element_to_be_clickable, EC.element_to_be_clickable),
+}
+# Each condition implies the weaker ones, see SeleniumUtils._cached_element
+_CONDITION_STRENGTH = {"presence": 0, "visibility": 1, "clickable": 2}
+
+# Locator names accepted by the helpers, mapped to the W3C strategy strings of By.*.
+# Built from ByName once at import, so every name in the Literal is guaranteed to
+# resolve and nothing is looked up on By per call. The By.* values themselves are
+# accepted as well.
+_BY_MAP: Final[Dict[str, str]] = {
+    name: getattr(By, name.upper()) for name in get_args(ByName)
+}
+_BY_MAP.update({strategy: strategy for strategy in list(_BY_MAP.values())})
+
+
+def _resolve_by(by: str) -> str:
+    """Returns the By.* strategy for a locator name, raising ValueError for unknown ones."""
+    try:
+        return _BY_MAP[by]
+    except KeyError:
+        raise ValueError(f"Invalid locator method: {by}") from None
+
+
+def _locator(by: str, value: str) -> Locator:
+    """Returns the resolved (By.*, value) tuple for a locator."""
+    return _resolve_by(by), value
+
+
+def _xpath_literal(value: str) -> str:
+    """
+    Quotes a value as an XPath 1.0 string literal. XPath has no escape sequences,
+    so values containing both quote types are built with concat().
+    """
+    if "'" not in value:
+        return f"'{value}'"
+    if '"' not in value:
+        return f'"{value}"'
+    return "concat(" + ", \"'\", ".join(f"'{part}'" for part in value.split("'")) + ")"
+
+
+# Element/attribute names that can be interpolated into an XPath as-is (optionally prefixed)
+_XPATH_NAME_RE = re.compile(r"^(?:[A-Za-z_][\w.-]*:)?[A-Za-z_][\w.-]*$")
+
+
+def _xpath_name(name: str, kind: str = "tag") -> str:
+    """
+    Returns `name` if it is a valid XPath name test (or '*'), raising ValueError otherwise,
+    so a malformed name fails immediately instead of timing out in the wait.
+    """
+    if name == "*" or _XPATH_NAME_RE.match(name):
+        return name
+    raise ValueError(f"Invalid {kind} name for an XPath: {name!r}")
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_xpath(tag: str, attribute: str, value: str, exact_match: bool) -> str:
+    """Builds (and memoizes) the attribute XPath, the same locators recur across CSV rows."""
+    tag = _xpath_name(tag)
+    attribute = _xpath_name(attribute, "attribute")
+    value = _xpath_literal(value)
+    if exact_match:
+        return f"//{tag}[@{attribute}={value}]"
+    return f"//{tag}[contains(@{attribute}, {value})]"
+
+
+# translate() arguments lower-casing ASCII letters for case-insensitive XPath matches
+_XP_UPPER = "'ABCDEFGHIJKLMNOPQRSTUVWXYZ'"
+_XP_LOWER = "'abcdefghijklmnopqrstuvwxyz'"
+
+# Single-slot XPath templates of the text/label helpers, filled with _xpath_literal output.
+# They test every own text node of the button, not only the first one (often just the
+# whitespace before an icon), like the collectByText script
+_BUTTONS_EXACT = ".//button[text()[normalize-space()=%s]]"
+_BUTTONS_CONTAINS = ".//button[text()[contains(., %s)]]"
+# Selector standing in for tag '*' in get_clickable_element_by_text: the actionable elements
+_CLICKABLE_CSS = "a, button, [role='button'], [onclick]"
+
+
+# Attribute names that can be used as-is in a CSS attribute selector
+_CSS_ATTRIBUTE_RE = re.compile(r"^[A-Za-z_][A-Za-z0-9_-]*$")
+
+
+def _css_string(value: str) -> str:
+    """Quotes a value as a CSS string literal."""
+    escaped = value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\a ")
+    return f'"{escaped}"'
+
+
+def _css_compatible(tag: str, attribute: str) -> bool:
+    """Whether the tag and attribute names can be used in a CSS attribute selector."""
+    return bool(_CSS_ATTRIBUTE_RE.match(attribute)) and (
+        tag == "*" or bool(_CSS_ATTRIBUTE_RE.match(tag))
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _build_css(tag: str, attribute: str, value: str, exact_match: bool) -> str:
+    """CSS counterpart of _build_xpath; the names must pass _css_compatible."""
+    operator = "=" if exact_match else "*="
+    css_tag = "" if tag == "*" else tag
+    return f"{css_tag}[{attribute}{operator}{_css_string(value)}]"
+
+
+@functools.lru_cache(maxsize=1024)
+def _best_locator(
+    tag: str, attribute: str, value: str, exact_match: bool
+) -> tuple[str, str]:
+    """
+    Picks the cheapest locator for an attribute lookup: By.ID for exact ids, a CSS
+    attribute selector (resolved by the browser's native selector engine) when the
+    attribute name allows it, and the construct_xpath XPath otherwise.
+    """
+    if attribute == "id" and exact_match:
+        return By.ID, value
+    if _css_compatible(tag, attribute):
+        return By.CSS_SELECTOR, _build_css(tag, attribute, value, exact_match)
+    return By.XPATH, _build_xpath(tag, attribute, value, exact_match)
+
+
+@functools.lru_cache(maxsize=1024)
+def _text_or_attribute_xpath(
+    text: str, tag: str, exact_match: bool, case_sensitive: bool = True
+) -> str:
+    """
+    XPath used by SeleniumUtils.find_element_by_text_or_attribute.
+    Tests the string value and attributes of each candidate itself rather than
+    walking every candidate's descendant-or-self axis.
+    """
+    tag = _xpath_name(tag)
+    if case_sensitive:
+        fold = lambda haystack: haystack
+    else:
+        text = text.lower()
+        fold = lambda haystack: f"translate({haystack}, {_XP_UPPER}, {_XP_LOWER})"
+    text = _xpath_literal(text)
+    if exact_match:
+        return f".//{tag}[{fold('normalize-space()')}={text}]"
+    predicates = " or ".join(
+        f"contains({fold(haystack)}, {text})"
+        for haystack in (".", "@class", "@aria-label", "@placeholder")
+    )
+    return f".//{tag}[{predicates}]"
+
+
+@functools.lru_cache(maxsize=256)
+def _button_xpath(
+    label: str,
+    exact_match: bool,
+    include_spans: bool,
+    include_inputs: bool,
+    case_sensitive: bool,
+) -> str:
+    """XPath used by SeleniumUtils.get_button_by_label."""
+    label_text = _xpath_literal(label if case_sensitive else label.lower())
+
+    def label_match(label_of: str) -> str:
+        # Only the haystack is lower-cased in the browser, the needle already is
+        haystack = f"normalize-space({label_of})"
+        if not case_sensitive:
+            haystack = f"translate({haystack}, {_XP_UPPER}, {_XP_LOWER})"
+        if exact_match:
+            return f"{haystack}={label_text}"
+        return f"contains({haystack},{label_text})"
+
+    # Build xpath conditions for text matching
+    text_match = label_match("")
+
+    # Base button selectors
+    button_conditions = [f".//button[{text_match}]"]  # Standard buttons
+    if exact_match:
+        # Buttons with nested elements. A substring of a nested element's text is also
+        # one of the button's own string value, so only exact matches need the descendant walk
+        button_conditions.append(f".//button[.//*[{text_match}]]")
+
+    # Add optional selectors
+    if include_spans:
+        button_conditions.extend([
+            f".//span[{text_match} and @role='button']",
+            f".//div[{text_match} and @role='button']",
+            f".//a[{text_match} and @role='button']"
+        ])
+
+    if include_inputs:
+        # Input buttons have no text, their label is the value (like the findButton script)
+        button_conditions.append(
+            f".//input[(@type='button' or @type='submit') and {label_match('@value')}]"
+        )
+
+    # Combine all conditions
+    return f"({' | '.join(button_conditions)})"
+
+
+@functools.lru_cache(maxsize=4)
+def _button_css(include_spans: bool, include_inputs: bool) -> str:
+    """CSS selector of the get_button_by_label candidates, same set as _button_xpath."""
+    selectors = ["button"]
+    if include_spans:
+        selectors.extend(("span[role=button]", "div[role=button]", "a[role=button]"))
+    if include_inputs:
+        selectors.extend(("input[type=button]", "input[type=submit]"))
+    return ", ".join(selectors)
+
+
+@functools.lru_cache(maxsize=256)
+def _buttons_xpath(label: str, exact_match: bool) -> str:
+    """XPath used by SeleniumUtils.get_buttons_by_label."""
+    return (_BUTTONS_EXACT if exact_match else _BUTTONS_CONTAINS) % _xpath_literal(label)
+
+
+# Every memoized locator builder, see SeleniumUtils.clear_xpath_cache
+_LOCATOR_CACHES = (
+    _build_xpath,
+    _build_css,
+    _best_locator,
+    _text_or_attribute_xpath,
+    _button_xpath,
+    _button_css,
+    _buttons_xpath,
+)
 
 
 class WaitUtils:
@@ -26,77 +291,263 @@ class WaitUtils:
     Utility class to handle waiting for elements using Selenium WebDriver.
     """
 
-    def __init__(self, driver: WebDriver, timeout: int = 10) -> None:
+    # Exceptions swallowed between polls, built once instead of per WebDriverWait
+    IGNORED_EXCEPTIONS = (NoSuchElementException, ElementNotVisibleException)
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: int = 10,
+        implicit_wait: Optional[float] = None,
+        poll_frequency: float = 0.1,
+        driver_wait: float = 0,
+    ) -> None:
         """
         Initializes the WaitUtils with the WebDriver instance and a default timeout.
 
         :param driver: The WebDriver instance to use.
         :param timeout: The maximum time to wait for elements (in seconds).
+        :param implicit_wait: The implicit wait configured on the driver (in seconds).
+                              It is tracked here so waits don't query it every time;
+                              None reads it from the driver once, on first use.
+        :param poll_frequency: Time between two checks of a wait condition (in seconds,
+                               Selenium's default is 0.5).
+        :param driver_wait: If set, the implicit wait (in seconds, capped at `timeout`)
+                            probe() leaves to the driver, so lookups of elements that
+                            appear shortly retry inside the driver instead of polling
+                            from Python. 0 keeps all waiting client-side.
         """
         self.driver = driver
-        self.wait = WebDriverWait(driver, timeout)
+        self.timeout = timeout
+        self._implicit_wait = implicit_wait
+        self.poll_frequency = poll_frequency
+        self.wait = self._new_wait(timeout)
+        self._waits: dict[float, WebDriverWait] = {timeout: self.wait}
+        self.driver_wait = min(driver_wait, timeout)
+        if self.driver_wait:
+            self.set_implicit_wait(self.driver_wait)
+
+    def _new_wait(self, timeout: float) -> WebDriverWait:
+        return WebDriverWait(
+            self.driver,
+            timeout,
+            poll_frequency=self.poll_frequency,
+            ignored_exceptions=self.IGNORED_EXCEPTIONS,
+        )
+
+    @property
+    def implicit_wait(self) -> float:
+        """The driver's implicit wait (in seconds), fetched once if it wasn't given."""
+        if self._implicit_wait is None:
+            try:
+                self._implicit_wait = self.driver.timeouts.implicit_wait
+            except (WebDriverException, AttributeError):
+                logger.debug("Could not read the implicit wait, assuming 0", exc_info=True)
+                self._implicit_wait = 0
+        return self._implicit_wait
+
+    @implicit_wait.setter
+    def implicit_wait(self, seconds: float) -> None:
+        self._implicit_wait = seconds
+
+    def set_implicit_wait(self, seconds: float) -> None:
+        """
+        Sets the driver's implicit wait and records it so explicit waits can suspend it.
+
+        :param seconds: The implicit wait (in seconds).
+        """
+        self.driver.implicitly_wait(seconds)
+        self.implicit_wait = seconds
+
+    @contextlib.contextmanager
+    def temporary_implicit_wait(self, seconds: float) -> Iterator[None]:
+        """
+        Overrides the driver's implicit wait for the duration of the block, e.g.
+        `with wait_utils.temporary_implicit_wait(0):` around code needing purely explicit
+        polling (staleness checks) when driver_wait is used.
+        No-op (and no extra driver call) when the implicit wait already has that value,
+        which includes blocks nested in one overriding it to the same value.
+
+        :param seconds: The implicit wait to use inside the block (in seconds).
+        """
+        previous = self.implicit_wait
+        if seconds == previous:
+            yield
+            return
+        self.driver.implicitly_wait(seconds)
+        self._implicit_wait = seconds
+        try:
+            yield
+        finally:
+            self.driver.implicitly_wait(previous)
+            self._implicit_wait = previous
+
+    def _no_implicit_wait(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Temporarily disables the implicit wait, otherwise every poll of an explicit
+        wait that misses blocks for the full implicit timeout.
+        """
+        return self.temporary_implicit_wait(0)
+
+    def remaining_timeout(self, timeout: Optional[float] = None) -> float:
+        """
+        Returns what is left of `timeout` (defaulting to the instance timeout) once a
+        probe() miss has used up the driver-side wait.
+        """
+        timeout = timeout or self.timeout
+        if not self.driver_wait:
+            return timeout
+        return max(timeout - self.implicit_wait, self.poll_frequency)
+
+    def until(self, condition, timeout: Optional[float] = None):
+        """
+        Waits until the condition returns a truthy value, with the implicit wait suspended.
+
+        :param condition: The condition to wait for (e.g., an expected_conditions callable).
+        :param timeout: The maximum time to wait (in seconds), defaults to the instance timeout.
+        :return: The condition's return value.
+        """
+        with self._no_implicit_wait():
+            return self.get_wait(timeout).until(condition)
+
+    def get_wait(self, timeout: Optional[float] = None) -> WebDriverWait:
+        """
+        Returns a WebDriverWait for the given timeout, reusing one per distinct timeout.
+
+        :param timeout: The maximum time to wait (in seconds), defaults to the instance timeout.
+        :return: The cached WebDriverWait instance.
+        """
+        timeout = timeout or self.timeout
+        wait = self._waits.get(timeout)
+        if wait is None:
+            wait = self._waits[timeout] = self._new_wait(timeout)
+        return wait
+
+    def lookup_scope(self) -> contextlib.AbstractContextManager[None]:
+        """
+        Context for a probe() followed by a wait: suspends the implicit wait once for both
+        instead of once per call. With driver_wait the probe keeps the implicit wait, so
+        this is a no-op then.
+        """
+        # With driver_wait the driver retries the lookup itself, for up to the implicit wait
+        return contextlib.nullcontext() if self.driver_wait else self._no_implicit_wait()
+
+    def probe(self, by: ByName, value: str) -> Optional[WebElement]:
+        """
+        Looks the element up once, without polling (and with the implicit wait suspended).
+
+        :param by: The method to locate the element (e.g., 'id', 'xpath').
+        :param value: The value of the locator (e.g., 'button-id').
+        :return: The WebElement if it is already present, otherwise None.
+        """
+        with self.lookup_scope():
+            try:
+                return self.driver.find_element(_resolve_by(by), value)
+            except NoSuchElementException:
+                return None
 
     def wait_for_element(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
+        value: str,
+        timeout: Optional[int] = None,
+    ) -> WebElement:
+        """
+        Enhanced wait_for_element with better error handling and timeout override.
+        Returns already present elements from a single lookup, without the polling wait.
+        """
+        with self.lookup_scope():
+            element = self.probe(by, value)
+            if element is not None:
+                return element
+            return self._wait_for_located(
+                EC.presence_of_element_located, by, value, self.remaining_timeout(timeout)
+            )
+
+    def wait_for_visible(
+        self,
+        by: ByName,
+        value: str,
+        timeout: Optional[int] = None,
+    ) -> WebElement:
+        """
+        Waits for an element to be present and visible, located by a specific selector.
+
+        :param by: The method to locate the element (e.g., 'id', 'xpath').
+        :param value: The value of the locator (e.g., 'button-id').
+        :param timeout: Optional custom timeout (in seconds).
+        :return: The visible WebElement, otherwise raises NoSuchElementException.
+        """
+        return self._wait_for_located(EC.visibility_of_element_located, by, value, timeout)
+
+    def wait_for_condition(
+        self,
+        condition: FindCondition,
+        by: ByName,
         value: str,
         timeout: Optional[int] = None,
     ) -> WebElement:
-        """Enhanced wait_for_element with better error handling and timeout override"""
+        """
+        Waits for an element to be present, visible or clickable.
+
+        :param condition: 'presence', 'visibility' or 'clickable'.
+        :param by: The method to locate the element (e.g., 'id', 'xpath').
+        :param value: The value of the locator (e.g., 'button-id').
+        :param timeout: Optional custom timeout (in seconds).
+        :return: The WebElement, otherwise raises NoSuchElementException.
+        """
+        try:
+            located = _FIND_CONDITIONS[condition][0]
+        except KeyError:
+            raise ValueError(f"Invalid wait condition: {condition}") from None
+        return self._wait_for_located(located, by, value, timeout)
+
+    def _wait_for_located(
+        self,
+        condition,
+        by: ByName,
+        value: str,
+        timeout: Optional[int] = None,
+    ) -> WebElement:
+        """Waits for a locator based expected condition, translating timeouts to NoSuchElementException."""
         if not self.driver:
             raise WebDriverException("Driver is not initialized")
             
         try:
-            wait = WebDriverWait(self.driver, timeout or self.wait._timeout)
-            by_attr = getattr(By, str(by).upper())
-            if not by_attr:
-                raise ValueError(f"Invalid locator method: {by}")
-                
-            element = wait.until(EC.presence_of_element_located((by_attr, value)))
-            if not element:
-                raise NoSuchElementException(f"Element not found with {by}={value}")
-                
-            return element
+            return self.until(condition(_locator(by, value)), timeout)
             
         except TimeoutException as e:
-            logger.error(f"Element not found within timeout: {by}={value}")
+            logger.error("Element not found within timeout: %s=%s", by, value)
             raise NoSuchElementException(f"Element not found with {by}={value}") from e
         except Exception as e:
-            logger.error(f"Error waiting for element: {by}={value}, Error: {str(e)}")
+            logger.error("Error waiting for element: %s=%s, Error: %s", by, value, e)
             raise
 
     def wait_for_clickable(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
         value: str,
+        timeout: Optional[int] = None,
     ) -> WebElement:
         """
         Waits for an element to be clickable, located by a specific selector.
 
         :param by: The method to locate the element (e.g., 'id', 'xpath').
         :param value: The value of the locator (e.g., 'button-id').
+        :param timeout: Optional custom timeout (in seconds).
         :return: The WebElement if found and clickable, otherwise raises TimeoutException.
         """
-        locator = (str(by), value)
-        return self.wait.until(EC.element_to_be_clickable(locator))
+        locator = _locator(by, value)
+        return self.until(EC.element_to_be_clickable(locator), timeout)
+
+
+def _js_library(functions: dict[str, str]) -> str:
+    """
+    Builds the script installing the helper snippets as window.__spp.<name>. Keeps an
+    already installed library, so installing it again (inline or on load) is harmless.
+    """
+    body = ",".join(f"{name}: function() {{{source}}}" for name, source in functions.items())
+    return f"window.__spp = window.__spp || {{{body}}};"
 
 
 class SeleniumUtils:
@@ -104,52 +555,461 @@ class SeleniumUtils:
     Utility class to perform common actions using Selenium WebDriver.
     """
 
-    def __init__(self, driver: WebDriver, timeout: int = 10) -> None:
+    # Sets every (css_selector, value) pair in one round-trip, returns the selectors not found.
+    # Values go through the prototype's value setter rather than the element's own property,
+    # which frameworks like React override to track changes (they'd drop the events otherwise)
+    _BULK_FILL_JS = """
+        const missing = [];
+        for (const [selector, value] of arguments[0]) {
+            const element = document.querySelector(selector);
+            if (!element) {
+                missing.push(selector);
+                continue;
+            }
+            const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+            if (descriptor && descriptor.set) descriptor.set.call(element, value);
+            else element.value = value;
+            element.dispatchEvent(new Event('input', {bubbles: true}));
+            element.dispatchEvent(new Event('change', {bubbles: true}));
+        }
+        return missing;
+    """
+
+    # Assigns value arguments[1] to element arguments[0] (like _BULK_FILL_JS) and fires the
+    # events typing would end with
+    _SET_VALUE_JS = """
+        const [element, value] = arguments;
+        element.focus();
+        const descriptor = Object.getOwnPropertyDescriptor(Object.getPrototypeOf(element), 'value');
+        if (descriptor && descriptor.set) descriptor.set.call(element, value);
+        else element.value = value;
+        element.dispatchEvent(new Event('input', {bubbles: true}));
+        element.dispatchEvent(new Event('change', {bubbles: true}));
+    """
+
+    # Elements matching selector arguments[0] with a direct text node containing arguments[1]
+    # (or equal to it when arguments[2] is true, like XPath's text()=...)
+    _COLLECT_BY_TEXT_JS = """
+        const [selector, text, exact] = arguments;
+        return Array.from(document.querySelectorAll(selector)).filter(
+            e => Array.from(e.childNodes).some(
+                n => n.nodeType === Node.TEXT_NODE
+                    && (exact ? n.nodeValue === text : n.nodeValue.includes(text))
+            )
+        );
+    """
+
+    # First usable (rendered, enabled) element matching selector arguments[0] without a
+    # button inside it, with a text node containing (or, normalized, equal to) arguments[1].
+    # Only its own text nodes are checked unless arguments[3] (include descendants).
+    # The button check and the text walk share one pass over the candidates.
+    _FIND_CLICKABLE_BY_TEXT_JS = """
+        const [selector, text, exact, includeDescendants] = arguments;
+        const normalize = s => s.replace(/[ \\t\\r\\n]+/g, ' ').trim();
+        const matches = n => exact ? normalize(n.nodeValue) === text : n.nodeValue.includes(text);
+        const hasText = e => {
+            if (!includeDescendants) {
+                return Array.from(e.childNodes).some(
+                    n => n.nodeType === Node.TEXT_NODE && matches(n)
+                );
+            }
+            const walker = document.createTreeWalker(e, NodeFilter.SHOW_TEXT);
+            while (walker.nextNode()) {
+                if (matches(walker.currentNode)) return true;
+            }
+            return false;
+        };
+        for (const e of document.querySelectorAll(selector)) {
+            if (e.disabled || !e.getClientRects().length) continue;
+            if (getComputedStyle(e).visibility === 'hidden') continue;
+            if (hasText(e) && !e.querySelector('button')) return e;
+        }
+        return null;
+    """
+
+    # In-page equivalent of _text_or_attribute_xpath(arguments[1], arguments[0], arguments[2],
+    # arguments[3]): returns the first element matching arguments[0] whose text (normalized
+    # when exact) or, for substring matches, class / aria-label / placeholder contains
+    # arguments[1] (compared lower-cased unless arguments[3] is true).
+    # Attribute matches win over text matches, like the former CSS fast path did.
+    _FIND_BY_TEXT_OR_ATTRIBUTE_JS = """
+        const [selector, text, exact, caseSensitive] = arguments;
+        const fold = caseSensitive ? s => s : s => s.toLowerCase();
+        const needle = fold(text);
+        const elements = document.querySelectorAll(selector);
+        if (exact) {
+            const normalize = s => s.replace(/[ \\t\\r\\n]+/g, ' ').trim();
+            for (const e of elements) {
+                if (fold(normalize(e.textContent)) === needle) return e;
+            }
+            return null;
+        }
+        let textMatch = null;
+        for (const e of elements) {
+            for (const name of ['aria-label', 'placeholder', 'class']) {
+                const attribute = e.getAttribute(name);
+                if (attribute !== null && fold(attribute).includes(needle)) return e;
+            }
+            if (textMatch === null && fold(e.textContent).includes(needle)) textMatch = e;
+        }
+        return textMatch;
+    """
+
+    # Selects the options of select arguments[0] whose text (arguments[2] true) or value
+    # equals arguments[1], like Select.select_by_visible_text / select_by_value, and fires
+    # the events a user selection would. Returns 'selected', 'disabled' or null (no match).
+    _SELECT_OPTION_JS = """
+        const [select, wanted, byText] = arguments;
+        const matches = Array.from(select.options).filter(
+            o => (byText ? o.text : o.value) === wanted
+        );
+        if (!matches.length) return null;
+        if (matches.some(o => o.disabled)) return 'disabled';
+        for (const o of select.multiple ? matches : matches.slice(0, 1)) o.selected = true;
+        select.dispatchEvent(new Event('input', {bubbles: true}));
+        select.dispatchEvent(new Event('change', {bubbles: true}));
+        return 'selected';
+    """
+
+    # Interaction state of element arguments[0] in one round-trip instead of is_enabled()
+    # + is_displayed(): [enabled and rendered, fully inside the viewport]
+    _MOVE_STATE_JS = """
+        const element = arguments[0];
+        const style = getComputedStyle(element);
+        const usable = !element.disabled && element.getClientRects().length > 0
+            && style.visibility !== 'hidden' && style.display !== 'none';
+        const r = element.getBoundingClientRect();
+        const inView = r.top >= 0 && r.left >= 0
+            && r.bottom <= window.innerHeight && r.right <= window.innerWidth;
+        return [usable, inView];
+    """
+
+    # Evaluates XPath arguments[0] in every same-origin iframe document, returns
+    # [first match or null, iframes whose document could not be read (cross-origin)]
+    _FIND_IN_FRAMES_JS = """
+        const xpath = arguments[0];
+        const unreadable = [];
+        for (const frame of document.querySelectorAll('iframe')) {
+            let doc = null;
+            try {
+                doc = frame.contentDocument;
+            } catch (e) {}
+            if (!doc) {
+                unreadable.push(frame);
+                continue;
+            }
+            const match = doc.evaluate(
+                xpath, doc, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+            ).singleNodeValue;
+            if (match) return [match, []];
+        }
+        return [null, unreadable];
+    """
+
+    # Whether the document's text contains arguments[0]. textContent avoids the layout
+    # innerText forces and, like the page source, includes hidden text
+    _PAGE_HAS_TEXT_JS = "return document.documentElement.textContent.includes(arguments[0]);"
+
+    # First usable (rendered, enabled) element matching selector arguments[0] whose label
+    # equals (arguments[2]) or contains arguments[1], compared lower-cased unless arguments[3].
+    # The label is an input's value, otherwise the normalized text; exact matches also
+    # accept a nested element with exactly that text, like _button_xpath.
+    _FIND_BUTTON_JS = """
+        const [selector, label, exact, caseSensitive] = arguments;
+        const normalize = s => s.replace(/[ \\t\\r\\n]+/g, ' ').trim();
+        const fold = caseSensitive ? s => s : s => s.toLowerCase();
+        const needle = fold(label);
+        const matches = e => {
+            const text = fold(normalize(e.tagName === 'INPUT' ? e.value : e.textContent));
+            if (!exact) return text.includes(needle);
+            return text === needle || Array.from(e.querySelectorAll('*')).some(
+                c => fold(normalize(c.textContent)) === needle
+            );
+        };
+        for (const e of document.querySelectorAll(selector)) {
+            if (e.disabled || !e.getClientRects().length) continue;
+            if (getComputedStyle(e).visibility === 'hidden') continue;
+            if (matches(e)) return e;
+        }
+        return null;
+    """
+
+    # Hovers element arguments[0] in one round-trip: returns false if it isn't usable
+    # (like moveState), otherwise centers it unless arguments[1] and it's already fully
+    # in view, and dispatches mouseover/mouseenter as a pointer move would
+    _HOVER_JS = """
+        const [element, onlyIfOutOfView] = arguments;
+        const style = getComputedStyle(element);
+        if (element.disabled || !element.getClientRects().length
+            || style.visibility === 'hidden' || style.display === 'none') return false;
+        const r = element.getBoundingClientRect();
+        const inView = r.top >= 0 && r.left >= 0
+            && r.bottom <= window.innerHeight && r.right <= window.innerWidth;
+        if (onlyIfOutOfView && inView) return true;
+        if (!inView) element.scrollIntoView({block: 'center'});
+        element.dispatchEvent(new MouseEvent('mouseover', {bubbles: true, view: window}));
+        element.dispatchEvent(new MouseEvent('mouseenter', {view: window}));
+        return true;
+    """
+
+    # Scrolls every element of arguments[0] into view in a single round-trip
+    _SCROLL_INTO_VIEW_JS = "arguments[0].forEach(e => e.scrollIntoView({block: 'center'}));"
+
+    # All snippets above, installed once per page as window.__spp so later calls only send
+    # _JS_CALL; _JS_INSTALL_AND_CALL installs them inline where they are missing
+    _JS_LIBRARY = _js_library(
+        {
+            "bulkFill": _BULK_FILL_JS,
+            "collectByText": _COLLECT_BY_TEXT_JS,
+            "findButton": _FIND_BUTTON_JS,
+            "findClickableByText": _FIND_CLICKABLE_BY_TEXT_JS,
+            "findByTextOrAttribute": _FIND_BY_TEXT_OR_ATTRIBUTE_JS,
+            "findInFrames": _FIND_IN_FRAMES_JS,
+            "hover": _HOVER_JS,
+            "moveState": _MOVE_STATE_JS,
+            "pageHasText": _PAGE_HAS_TEXT_JS,
+            "selectOption": _SELECT_OPTION_JS,
+            "setValue": _SET_VALUE_JS,
+            "scrollIntoView": _SCROLL_INTO_VIEW_JS,
+        }
+    )
+    _JS_CALL = "const spp = window.__spp; return spp ? [true, spp.%s.apply(null, arguments)] : [false];"
+    _JS_INSTALL_AND_CALL = _JS_LIBRARY + "return window.__spp.%s.apply(null, arguments);"
+
+    # Maximum number of located elements kept by find_element's element cache
+    _ELEMENT_CACHE_SIZE = 128
+
+    def __init__(
+        self,
+        driver: WebDriver,
+        timeout: int = 10,
+        wait_utils: Optional[WaitUtils] = None,
+        poll_frequency: float = 0.1,
+        element_cache_ttl: float = 0,
+        driver_wait: float = 0,
+    ) -> None:
         """
         Initializes SeleniumUtils with WebDriver, timeout, and related utilities.
 
         :param driver: The WebDriver instance to use.
         :param timeout: The maximum time to wait for elements (in seconds).
+        :param wait_utils: An existing WaitUtils to share (its timeout, poll frequency and
+                           driver wait are used instead of the arguments below).
+        :param poll_frequency: Time between two checks of a wait condition (in seconds).
+        :param driver_wait: Part of each find handed to the driver's implicit wait (in
+                            seconds, see WaitUtils), 0 keeps all waiting client-side.
+        :param element_cache_ttl: How long find_element may reuse an element it already
+                                  located for the same locator (in seconds, 0 disables it).
+                                  Hits cost no round-trip, so an element removed from the
+                                  page within that time raises StaleElementReferenceException
+                                  when used (call clear_element_cache after re-renders).
         """
         if not driver:
             raise ValueError("WebDriver instance is required")
         self.driver = driver
-        self.wait_utils = WaitUtils(driver, timeout)
-        self.action_chains = ActionChains(driver)
+        self.wait_utils = wait_utils or WaitUtils(
+            driver, timeout, poll_frequency=poll_frequency, driver_wait=driver_wait
+        )
+        self._action_chains: Optional[ActionChains] = None
+        self.element_cache_ttl = element_cache_ttl
+        self._element_cache: OrderedDict[
+            Locator, tuple[float, WebElement, FindCondition]
+        ] = OrderedDict()
+        self._preload_js_library()
 
-    def move_to_element(self, element: WebElement) -> None:
+    def _preload_js_library(self) -> None:
+        """
+        On Chromium drivers, registers the JS library to be evaluated in every new document,
+        so _call_js never has to send it. Other drivers install it inline on first use per page.
+        """
+        execute_cdp_cmd = getattr(self.driver, "execute_cdp_cmd", None)
+        if execute_cdp_cmd is None:
+            return
+        try:
+            execute_cdp_cmd(
+                "Page.addScriptToEvaluateOnNewDocument", {"source": self._JS_LIBRARY}
+            )
+        except WebDriverException:
+            logger.debug("Could not preload the JS library", exc_info=True)
+
+    def _call_js(self, name: str, *args):
+        """
+        Calls window.__spp.<name>(*args), sending only a small stub when the library is
+        already installed in the page and the whole library (once) when it is not.
+        """
+        installed = self.driver.execute_script(self._JS_CALL % name, *args)
+        if installed[0]:
+            return installed[1]
+        return self.driver.execute_script(self._JS_INSTALL_AND_CALL % name, *args)
+
+    def clear_element_cache(
+        self, by: Optional[ByName] = None, value: Optional[str] = None
+    ) -> None:
+        """
+        Forgets the elements cached by find_element: every one (e.g. after a navigation),
+        or only the one for `by`/`value` after the page re-rendered that element.
+
+        :param by: The locator method of the element to forget.
+        :param value: The locator value of the element to forget.
+        """
+        if by is None or value is None:
+            self._element_cache.clear()
+        else:
+            self._element_cache.pop((_resolve_by(by), value), None)
+
+    def navigate(self, url: str) -> None:
+        """
+        Loads `url` in the driver and drops the element cache, whose entries all belong
+        to the previous page.
+
+        :param url: The URL to load.
+        """
+        self.driver.get(url)
+        self.clear_element_cache()
+
+    def _cached_element(
+        self, key: Locator, condition: FindCondition
+    ) -> Optional[WebElement]:
+        """
+        Returns the element cached for `key` if it is recent and was verified against
+        `condition` or a stricter one. Costs no round-trip: liveness isn't checked here,
+        a stale hit only shows once the element is used.
+        """
+        entry = self._element_cache.get(key)
+        if entry is None:
+            return None
+        stored_at, element, verified = entry
+        if time.monotonic() - stored_at > self.element_cache_ttl:
+            del self._element_cache[key]
+            return None
+        if _CONDITION_STRENGTH[verified] < _CONDITION_STRENGTH[condition]:
+            return None
+        self._element_cache.move_to_end(key)
+        return element
+
+    def _cache_element(
+        self, key: Locator, element: WebElement, verified: FindCondition
+    ) -> None:
+        self._element_cache[key] = (time.monotonic(), element, verified)
+        self._element_cache.move_to_end(key)
+        if len(self._element_cache) > self._ELEMENT_CACHE_SIZE:
+            self._element_cache.popitem(last=False)
+
+    @property
+    def action_chains(self) -> ActionChains:
+        """The shared ActionChains, only created once an action is actually needed."""
+        if self._action_chains is None:
+            self._action_chains = ActionChains(self.driver)
+        return self._action_chains
+
+    def _clear_queued_actions(self) -> None:
+        """
+        Drops the actions queued on the shared chain locally. perform() keeps them,
+        so without this the next perform() would replay every previous move
+        (the reset_actions() alternative costs an extra round-trip).
+        """
+        for device in self.action_chains.w3c_actions.devices:
+            device.clear_actions()
+
+    def _element_state(self, element: WebElement) -> tuple[bool, bool]:
+        """
+        Returns (usable, fully in viewport) for the element with the single moveState
+        script, instead of one is_displayed() and one is_enabled() round-trip. Falls back
+        to those two calls if the script can't run on the element.
+        """
+        try:
+            usable, in_view = self._call_js("moveState", element)
+            return usable, in_view
+        except JavascriptException:
+            return element.is_displayed() and element.is_enabled(), False
+
+    def _jshover(self, element: WebElement, only_if_out_of_view: bool = False) -> bool:
+        """
+        Brings the element into view and fires mouseover on it with the single hover
+        script, instead of the moveState check plus an ActionChains perform().
+
+        :param element: The WebElement to hover.
+        :param only_if_out_of_view: Do nothing when the element is already fully in view.
+        :return: False if the element is not visible or enabled.
+        """
+        return self._call_js("hover", element, only_if_out_of_view)
+
+    def move_to_element(
+        self,
+        element: WebElement,
+        only_if_out_of_view: bool = False,
+        use_action_chains: bool = False,
+    ) -> None:
         """
         Moves the mouse pointer to the specified WebElement.
 
         :param element: The WebElement to move to.
+        :param only_if_out_of_view: Skip the move when the element is already fully in the
+                                    viewport (the helpers use this, they only move to bring
+                                    elements into view, not to hover them).
+        :param use_action_chains: Move the real pointer with ActionChains instead of the
+                                  one-call JS hover, for pages that rely on CSS :hover or
+                                  trusted pointer events.
         """
-        if not element:
+        if element is None:
             logger.error("Cannot move to None element")
             return
-            
+
+        if not use_action_chains:
+            try:
+                if not self._jshover(element, only_if_out_of_view):
+                    logger.warning("Element is not visible or enabled")
+                return
+            except JavascriptException:
+                logger.debug("Hover script failed, using ActionChains", exc_info=True)
+            except WebDriverException:
+                logger.exception("Failed to move to element")
+                return
+
         try:
-            if not element.is_enabled() or not element.is_displayed():
+            usable, in_view = self._element_state(element)
+            if not usable:
                 logger.warning("Element is not visible or enabled")
                 return
-                
+            if only_if_out_of_view and in_view:
+                return
+
             self.action_chains.move_to_element(element).perform()
-        except Exception as e:
-            logger.error(f"Failed to move to element: {str(e)}")
+        except Exception:
+            logger.exception("Failed to move to element")
+            # A failed perform() can leave input state behind on the remote end,
+            # release it there too (only costs a round-trip on this error path)
+            try:
+                self.action_chains.reset_actions()
+            except WebDriverException:
+                logger.debug("Failed to reset remote actions", exc_info=True)
+        finally:
+            self._clear_queued_actions()
+
+    def _bulk_move(self, elements: List[WebElement]) -> None:
+        """
+        Scrolls all elements into view with one execute_script call instead of one
+        ActionChains round-trip per element. A chained Actions sequence would also be
+        one call, but the driver rejects pointer moves to targets outside the viewport,
+        which is exactly where list results tend to be. Callers needing a hover (tooltips)
+        can move_to_element the element they care about afterwards.
+
+        :param elements: The WebElements to bring into view.
+        """
+        if not elements:
+            return
+        try:
+            self._call_js("scrollIntoView", elements)
+        except WebDriverException:
+            logger.exception("Failed to scroll to elements")
 
     def find_element(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
         value: str,
         move_to_element: bool = True,
+        fast_path: bool = True,
+        condition: Optional[FindCondition] = None,
     ) -> WebElement:
         """
         Finds an element based on the provided locator and optionally moves to it.
@@ -157,40 +1017,123 @@ class SeleniumUtils:
         :param by: The method to locate the element (e.g., 'id', 'xpath').
         :param value: The value of the locator (e.g., 'button-id').
         :param move_to_element: Whether to move to the element after finding it.
+        :param fast_path: Whether to try one immediate lookup before the polling wait.
+                          Disable it for pages that lazy-render, where an early match may
+                          not be the element that ends up being shown.
+        :param condition: 'presence', 'visibility' or 'clickable': the state to wait for, so
+                          callers about to interact wait once for a usable element. An
+                          immediately found element is checked against it (one extra call).
+                          By default waits on visibility when moving to the element and on
+                          presence otherwise, without checking immediate matches.
         :return: The located WebElement.
         """
         if not value:
             raise ValueError("Locator value cannot be empty")
-            
+        # Normalize once, so an unknown locator method fails fast instead of inside the wait
+        by = _resolve_by(by)
+        check_probe = condition is not None
+        if condition is None:
+            condition = "visibility" if move_to_element else "presence"
+        if condition not in _FIND_CONDITIONS:
+            raise ValueError(f"Invalid wait condition: {condition}")
+
         try:
-            element = self.wait_utils.wait_for_element(by, value)
-            if not element:
-                raise NoSuchElementException(f"Element not found with {by}={value}")
-                
+            if self.element_cache_ttl:
+                # Without an explicit condition an immediate match isn't checked either
+                required = condition if check_probe else "presence"
+                element = self._cached_element((by, value), required)
+                if element is not None:
+                    try:
+                        # The move is the hit's only round-trip, a stale entry shows there
+                        if move_to_element and not self._jshover(element, True):
+                            logger.warning("Element is not visible or enabled")
+                        return element
+                    except StaleElementReferenceException:
+                        del self._element_cache[(by, value)]
+                    except JavascriptException:
+                        self.move_to_element(
+                            element, only_if_out_of_view=True, use_action_chains=True
+                        )
+                        return element
+
+            # The condition the returned element is known to meet, for the cache
+            verified = condition
+            with self.wait_utils.lookup_scope():
+                # Already present elements (the common case) skip the polling wait entirely
+                element = self.wait_utils.probe(by, value) if fast_path else None
+                if element is not None:
+                    if check_probe:
+                        element = self._check_condition(element, condition)
+                    else:
+                        verified = "presence"
+                if element is None:
+                    verified = condition
+                    # A missed probe may already have spent the driver-side wait
+                    timeout = self.wait_utils.remaining_timeout() if fast_path else None
+                    element = self.wait_utils.wait_for_condition(
+                        condition, by, value, timeout
+                    )
+
+            logger.debug("Found element %s=%s", by, value)
+            if self.element_cache_ttl:
+                self._cache_element((by, value), element, verified)
             if move_to_element:
-                self.move_to_element(element)
+                self.move_to_element(element, only_if_out_of_view=True)
             return element
             
         except Exception as e:
-            logger.error(f"Failed to find element: {by}={value}, Error: {str(e)}")
+            logger.error("Failed to find element: %s=%s, Error: %s", by, value, e)
             raise
 
+    def _check_condition(
+        self, element: WebElement, condition: FindCondition
+    ) -> Optional[WebElement]:
+        """
+        Returns the element if it is in the `condition` state, None otherwise (also when
+        it went stale). Costs one call, none for 'presence'.
+        """
+        element_check = _FIND_CONDITIONS[condition][1]
+        if element_check is None:
+            return element
+        try:
+            return element_check(element)(self.driver) or None
+        except StaleElementReferenceException:
+            return None
+
+    def find_many(
+        self, queries: List[Locator], drivers: Optional[List[WebDriver]] = None
+    ) -> List[WebElement]:
+        """
+        Looks up independent locators concurrently, one immediate find_element each
+        (no polling wait), so their round-trips overlap instead of running back to back.
+        Only use it for read-only lookups: interactions must not be parallelized.
+
+        :param queries: (by, value) locators to look up.
+        :param drivers: Optional pool of sessions on the same page to spread the
+                        queries over (round-robin); defaults to this instance's driver.
+                        Elements belong to the session that found them.
+        :return: The WebElements, in the order of `queries`.
+        :raises NoSuchElementException: If any locator matches nothing.
+        """
+        if not queries:
+            return []
+        pool = drivers or [self.driver]
+        locators = [_locator(by, value) for by, value in queries]
+
+        def find(index: int) -> WebElement:
+            return pool[index % len(pool)].find_element(*locators[index])
+
+        with ThreadPoolExecutor(max_workers=min(8, len(locators))) as executor:
+            return list(executor.map(find, range(len(locators))))
+
     def fill_input(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
         value: str,
         input_text: str,
         exact_match: bool = False,
         move_to_element: bool = True,
+        use_js: bool = False,
     ) -> None:
         """
         Fills an input field with the specified text.
@@ -200,31 +1143,58 @@ class SeleniumUtils:
         :param input_text: The text to input.
         :param exact_match: Whether to match the locator exactly.
         :param move_to_element: Whether to move to the element after finding it.
+        :param use_js: If True, assigns the value in one execute_script call (firing
+                       'input' and 'change') instead of clear() + send_keys(); no key
+                       events are generated, so per-key handlers don't run.
         """
-        input_element = self.find_element(by, value, move_to_element)
+        input_element = self.find_element(
+            by, value, move_to_element, condition="visibility"
+        )
         if input_element:
             try:
-                input_element.clear()
-                input_element.send_keys(input_text)
-                logger.info(
-                    f"Successfully filled the input field '{value}' with text: {input_text}"
+                if use_js:
+                    self._call_js("setValue", input_element, input_text)
+                else:
+                    input_element.clear()
+                    input_element.send_keys(input_text)
+                logger.debug(
+                    "Successfully filled the input field '%s' with text: %s",
+                    value,
+                    input_text,
                 )
-            except WebDriverException as e:
-                logger.error(f"Failed to fill input field '{value}': {e}")
-                raise e
+            except WebDriverException:
+                logger.exception("Failed to fill input field '%s'", value)
+                raise
+
+    def _js_select(
+        self,
+        select_element: WebElement,
+        *,
+        by_text: Optional[str] = None,
+        by_value: Optional[str] = None,
+    ) -> None:
+        """
+        Selects an option with one execute_script call, instead of the option lookups
+        and clicks Select issues one round-trip at a time.
+
+        :param select_element: The <select> WebElement.
+        :param by_text: The visible text of the option to select.
+        :param by_value: The value attribute of the option to select (if by_text is None).
+        :raises NoSuchElementException: If no option matches.
+        :raises NotImplementedError: If the matching option is disabled (as Select does).
+        """
+        by_text_match = by_text is not None
+        wanted = by_text if by_text_match else by_value
+        status = self._call_js("selectOption", select_element, wanted, by_text_match)
+        if status is None:
+            kind = "text" if by_text_match else "value"
+            raise NoSuchElementException(f"Cannot locate option with {kind}: {wanted}")
+        if status == "disabled":
+            raise NotImplementedError("You may not select a disabled option")
 
     def select_option_by_text(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
         value: str,
         option_text: str,
         exact_match: bool = False,
@@ -239,32 +1209,26 @@ class SeleniumUtils:
         :param exact_match: Whether to match the locator exactly.
         :param move_to_element: Whether to move to the element after finding it.
         """
-        select_element = self.find_element(by, value, move_to_element)
+        select_element = self.find_element(
+            by, value, move_to_element, condition="visibility"
+        )
         if select_element:
             try:
-                select = Select(select_element)
-                select.select_by_visible_text(option_text)
-                logger.info(
-                    f"Successfully selected option '{option_text}' for field '{value}'"
+                self._js_select(select_element, by_text=option_text)
+                logger.debug(
+                    "Successfully selected option '%s' for field '%s'",
+                    option_text,
+                    value,
                 )
-            except WebDriverException as e:
-                logger.error(
-                    f"Failed to select option '{option_text}' for field '{value}': {e}"
+            except WebDriverException:
+                logger.exception(
+                    "Failed to select option '%s' for field '%s'", option_text, value
                 )
-                raise e
+                raise
 
     def select_option_by_value(
         self,
-        by: Literal[
-            "id",
-            "xpath",
-            "link_text",
-            "partial_link_text",
-            "name",
-            "tag_name",
-            "class_name",
-            "css_selector",
-        ],
+        by: ByName,
         value: str,
         option_value: str,
         exact_match: bool = False,
@@ -279,25 +1243,30 @@ class SeleniumUtils:
         :param exact_match: Whether to match the locator exactly.
         :param move_to_element: Whether to move to the element after finding it.
         """
-        select_element = self.find_element(by, value, move_to_element)
+        select_element = self.find_element(
+            by, value, move_to_element, condition="visibility"
+        )
         if select_element:
             try:
-                select = Select(select_element)
-                select.select_by_value(option_value)
-                logger.info(
-                    f"Successfully selected value '{option_value}' for field '{value}'"
+                self._js_select(select_element, by_value=option_value)
+                logger.debug(
+                    "Successfully selected value '%s' for field '%s'",
+                    option_value,
+                    value,
                 )
-            except WebDriverException as e:
-                logger.error(
-                    f"Failed to select value '{option_value}' for field '{value}': {e}"
+            except WebDriverException:
+                logger.exception(
+                    "Failed to select value '%s' for field '%s'", option_value, value
                 )
-                raise e
+                raise
 
+    @staticmethod
     def construct_xpath(
-        self, tag: str, attribute: str, value: str, exact_match: bool
+        tag: str, attribute: str, value: str, exact_match: bool
     ) -> str:
         """
         Constructs an XPath expression based on the provided tag, attribute, value, and match type.
+        Results are memoized, so repeated lookups return the same string object.
 
         :param tag: The HTML tag to search for (e.g., 'input', 'select').
         :param attribute: The attribute to match on (e.g., 'id', 'name').
@@ -305,11 +1274,34 @@ class SeleniumUtils:
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :return: The constructed XPath string.
         """
-        return (
-            f"//{tag}[@{attribute}='{value}']"
-            if exact_match
-            else f"//{tag}[contains(@{attribute}, '{value}')]"
-        )
+        return _build_xpath(tag, attribute, value, exact_match)
+
+    @staticmethod
+    def clear_xpath_cache() -> None:
+        """
+        Empties the memoized XPath, CSS and locator caches (shared by all instances),
+        e.g. between test suites, so selectors of finished runs don't linger.
+        """
+        for builder in _LOCATOR_CACHES:
+            builder.cache_clear()
+
+    @staticmethod
+    def construct_css(
+        tag: str, attribute: str, value: str, exact_match: bool
+    ) -> str:
+        """
+        Constructs a CSS selector equivalent to construct_xpath ('=' for exact matches, '*=' otherwise).
+
+        :param tag: The HTML tag to search for (e.g., 'input', 'select'), or '*' for any tag.
+        :param attribute: The attribute to match on (e.g., 'id', 'name').
+        :param value: The value of the attribute to match.
+        :param exact_match: If True, matches the attribute exactly; otherwise, uses a substring match.
+        :return: The constructed CSS selector string.
+        :raises ValueError: If the tag or attribute name cannot be expressed in CSS.
+        """
+        if not _css_compatible(tag, attribute):
+            raise ValueError(f"Cannot build a CSS selector for <{tag} {attribute}>")
+        return _build_css(tag, attribute, value, exact_match)
 
     def find_element_by_text_or_attribute(
         self,
@@ -317,6 +1309,7 @@ class SeleniumUtils:
         tag: str = "*",
         exact_match: bool = False,
         move_to_element: bool = True,
+        case_sensitive: bool = True,
     ) -> WebElement:
         """
         Finds an element by its text or various attributes (e.g., class, aria-label, placeholder).
@@ -325,14 +1318,44 @@ class SeleniumUtils:
         :param tag: The HTML tag to search within (default is any tag).
         :param exact_match: If True, matches the text exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
+        :param case_sensitive: Whether to match text and attributes case sensitively.
         :return: The found WebElement.
         """
-        xpath = (
-            f".//{tag}[descendant-or-self::*[text()='{text}']]"
-            if exact_match
-            else f".//{tag}[descendant-or-self::*[contains(text(), '{text}') or contains(@class, '{text}') or contains(@aria-label, '{text}') or contains(@placeholder, '{text}')]]"
-        )
-        return self.find_element(By.XPATH, xpath, move_to_element)
+        if tag != "*" and not _CSS_ATTRIBUTE_RE.match(tag):
+            # Namespaced or otherwise non-CSS tags can only be expressed in XPath
+            xpath = _text_or_attribute_xpath(text, tag, exact_match, case_sensitive)
+            return self.find_element(By.XPATH, xpath, move_to_element)
+
+        element = self._find_by_text_js(text, tag, exact_match, case_sensitive)
+        if move_to_element:
+            self.move_to_element(element, only_if_out_of_view=True)
+        return element
+
+    def _find_by_text_js(
+        self, text: str, tag: str, exact_match: bool, case_sensitive: bool = True
+    ) -> WebElement:
+        """
+        Polls _FIND_BY_TEXT_OR_ATTRIBUTE_JS (one execute_script per poll, filtered with the
+        browser's native querySelectorAll) and only runs the XPath once if it times out.
+
+        :raises NoSuchElementException: If neither the script nor the XPath finds a match.
+        """
+        try:
+            return self.wait_utils.until(
+                lambda driver: self._call_js(
+                    "findByTextOrAttribute", tag, text, exact_match, case_sensitive
+                )
+                or False
+            )
+        except TimeoutException as e:
+            xpath = _text_or_attribute_xpath(text, tag, exact_match, case_sensitive)
+            element = self.wait_utils.probe(By.XPATH, xpath)
+            if element is None:
+                logger.error("No element found with text or attribute: %s", text)
+                raise NoSuchElementException(
+                    f"No element found with text or attribute {text!r}"
+                ) from e
+            return element
 
     def fill_input_by_attribute(
         self,
@@ -341,6 +1364,7 @@ class SeleniumUtils:
         input_text: str,
         exact_match: bool = False,
         move_to_element: bool = True,
+        use_js: bool = False,
     ) -> None:
         """
         Fills an input field located by a specific attribute and value.
@@ -350,9 +1374,82 @@ class SeleniumUtils:
         :param input_text: The text to input into the field.
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
+        :param use_js: If True, assigns the value with one script call instead of clear() +
+                       send_keys() (see fill_input); no key events are generated.
+        """
+        by, locator = _best_locator("input", attribute, attribute_name, exact_match)
+        self.fill_input(by, locator, input_text, exact_match, move_to_element, use_js)
+
+    def precompute_input_locator(
+        self, attribute: str, attribute_name: str, exact_match: bool = False
+    ) -> Locator:
         """
-        xpath = self.construct_xpath("input", attribute, attribute_name, exact_match)
-        self.fill_input(By.XPATH, xpath, input_text, exact_match, move_to_element)
+        Resolves the locator fill_input_by_attribute would use, so loops filling the
+        same field many times can build it once and call fill_input_locator.
+
+        :param attribute: The HTML attribute to search for (e.g., 'id', 'name').
+        :param attribute_name: The value of the attribute.
+        :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
+        :return: The (by, value) locator.
+        """
+        return _best_locator("input", attribute, attribute_name, exact_match)
+
+    def fill_input_locator(
+        self,
+        locator: Locator,
+        input_text: str,
+        move_to_element: bool = False,
+        use_js: bool = False,
+    ) -> None:
+        """
+        Fills an input field located by a precomputed locator.
+
+        :param locator: The (by, value) pair, e.g. from precompute_input_locator.
+        :param input_text: The text to input into the field.
+        :param move_to_element: Whether to move to the element after finding it.
+        :param use_js: If True, assigns the value with one script call instead of clear() +
+                       send_keys() (see fill_input); no key events are generated.
+        """
+        by, value = locator
+        self.fill_input(
+            by, value, input_text, move_to_element=move_to_element, use_js=use_js
+        )
+
+    def bulk_fill(self, items: List[tuple[str, str]]) -> List[str]:
+        """
+        Fills many fields with a single execute_script call instead of one
+        find_element + clear + send_keys round-trip sequence per field.
+        Values are assigned directly and 'input'/'change' events are dispatched,
+        so no key events are generated.
+
+        :param items: (css_selector, value) pairs, e.g. built from read_csv rows.
+        :return: The selectors that matched no element.
+        """
+        missing = self._call_js("bulkFill", [list(item) for item in items])
+        if missing:
+            logger.warning("bulk_fill found no element for: %s", missing)
+        return missing or []
+
+    def batch_fill_inputs(
+        self, fields: Dict[str, str], by_attribute: str = "name", exact_match: bool = True
+    ) -> List[str]:
+        """
+        Fills many input fields located by the same attribute in one round-trip (see bulk_fill).
+        Use fill_input_by_attribute instead for fields whose per-key handlers must fire.
+
+        :param fields: Mapping of attribute values to the text to put in each field.
+        :param by_attribute: The HTML attribute the keys refer to (e.g., 'name', 'id').
+        :param exact_match: If True, matches the attribute exactly; otherwise, uses a substring match.
+        :return: The keys of `fields` whose input was not found.
+        """
+        selectors = {
+            self.construct_css("input", by_attribute, name, exact_match): name
+            for name in fields
+        }
+        missing = self.bulk_fill(
+            [(selector, fields[name]) for selector, name in selectors.items()]
+        )
+        return [selectors[selector] for selector in missing]
 
     def fill_select_by_text(
         self,
@@ -371,9 +1468,9 @@ class SeleniumUtils:
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
         """
-        xpath = self.construct_xpath("select", attribute, attribute_name, exact_match)
+        by, locator = _best_locator("select", attribute, attribute_name, exact_match)
         self.select_option_by_text(
-            By.XPATH, xpath, option_text, exact_match, move_to_element
+            by, locator, option_text, exact_match, move_to_element
         )
 
     def fill_select_by_value(
@@ -393,9 +1490,9 @@ class SeleniumUtils:
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
         """
-        xpath = self.construct_xpath("select", attribute, attribute_name, exact_match)
+        by, locator = _best_locator("select", attribute, attribute_name, exact_match)
         self.select_option_by_value(
-            By.XPATH, xpath, option_value, exact_match, move_to_element
+            by, locator, option_value, exact_match, move_to_element
         )
 
     def fill_boolean_select(
@@ -415,9 +1512,9 @@ class SeleniumUtils:
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
         """
-        option_value = "Yes" if value else "No"
-        self.fill_select_by_text(
-            attribute, attribute_name, option_value, exact_match, move_to_element
+        by, locator = _best_locator("select", attribute, attribute_name, exact_match)
+        self.select_option_by_text(
+            by, locator, "Yes" if value else "No", exact_match, move_to_element
         )
 
     def fill_date_input(
@@ -427,6 +1524,7 @@ class SeleniumUtils:
         date: str,
         exact_match: bool = False,
         move_to_element: bool = True,
+        use_js: bool = False,
     ) -> None:
         """
         Fills a date input field located by a specific attribute and value.
@@ -436,9 +1534,11 @@ class SeleniumUtils:
         :param date: The date to input (e.g., '2024-10-14').
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
+        :param use_js: If True, assigns the ISO value directly (see fill_input), which also
+                       avoids typing it in the browser locale's date format.
         """
-        xpath = self.construct_xpath("input", attribute, attribute_name, exact_match)
-        self.fill_input(By.XPATH, xpath, date, exact_match, move_to_element)
+        by, locator = _best_locator("input", attribute, attribute_name, exact_match)
+        self.fill_input(by, locator, date, exact_match, move_to_element, use_js)
 
     def fill_datetime_input(
         self,
@@ -447,6 +1547,7 @@ class SeleniumUtils:
         datetime_str: str,
         exact_match: bool = False,
         move_to_element: bool = True,
+        use_js: bool = False,
     ) -> None:
         """
         Fills a datetime input field located by a specific attribute and value.
@@ -456,13 +1557,17 @@ class SeleniumUtils:
         :param datetime_str: The datetime to input (e.g., '2024-10-14T12:00').
         :param exact_match: If True, matches the attribute exactly; otherwise, uses 'contains'.
         :param move_to_element: Whether to move to the element after finding it.
+        :param use_js: If True, assigns the ISO value directly (see fill_date_input).
         """
-        self.fill_date_input(
-            attribute, attribute_name, datetime_str, exact_match, move_to_element
-        )
+        by, locator = _best_locator("input", attribute, attribute_name, exact_match)
+        self.fill_input(by, locator, datetime_str, exact_match, move_to_element, use_js)
 
     def find_element_by_id(
-        self, element_id: str, exact_match: bool = False, move_to_element: bool = True
+        self,
+        element_id: str,
+        exact_match: bool = False,
+        move_to_element: bool = True,
+        fast_path: bool = True,
     ) -> WebElement:
         """
         Finds an element by its ID.
@@ -470,9 +1575,10 @@ class SeleniumUtils:
         :param element_id: The ID of the element to search for.
         :param exact_match: If True, matches the ID exactly.
         :param move_to_element: Whether to move to the element after finding it.
+        :param fast_path: Whether to try one immediate lookup before the polling wait.
         :return: The found WebElement.
         """
-        return self.find_element(By.ID, element_id, move_to_element)
+        return self.find_element(By.ID, element_id, move_to_element, fast_path)
 
     def get_element_by_attribute(
         self,
@@ -482,6 +1588,7 @@ class SeleniumUtils:
         tag: str = "*",
         exact_match: bool = True,
         move_to_element: bool = True,
+        timeout: Optional[float] = None,
     ) -> WebElement:
         """
         Waits for an element to be located by a specific attribute and value.
@@ -492,12 +1599,14 @@ class SeleniumUtils:
         :param tag: The HTML tag to search within (default is any tag).
         :param exact_match: If True, matches the attribute exactly.
         :param move_to_element: Whether to move to the element after finding it.
+        :param timeout: Optional custom timeout (in seconds), e.g. shorter for locators
+                        known to resolve fast.
         :return: The located WebElement.
         """
-        xpath = self.construct_xpath(tag, attribute, attribute_value, exact_match)
-        element = self.wait_utils.wait.until(wait_condition((By.XPATH, xpath)))
-        if element and move_to_element:
-            self.move_to_element(element)
+        locator = _best_locator(tag, attribute, attribute_value, exact_match)
+        element = self.wait_utils.until(wait_condition(locator), timeout)
+        if move_to_element:
+            self.move_to_element(element, only_if_out_of_view=True)
         return element
 
     def get_clickable_element_by_text(
@@ -511,27 +1620,36 @@ class SeleniumUtils:
         """
         Fixed version that properly finds clickable elements with text.
         Added include_descendants parameter to control text search scope.
+        With the default tag '*', returns the enclosing link, button, role=button or
+        onclick element rather than the element directly holding the text.
+        Each poll is one findClickableByText call instead of an XPath evaluation walking
+        every candidate's descendants twice (once for the text, once for buttons).
+
+        :param tag: CSS selector restricting the candidates (e.g., 'a', 'button').
         """
-        text_match = "text()" if not include_descendants else ".//text()"
-        xpath = (
-            f".//{tag}[normalize-space({text_match})='{text}' and not(descendant::button)]"
-            if exact_match
-            else f".//{tag}[contains({text_match}, '{text}') and not(descendant::button)]"
-        )
+        selector = _CLICKABLE_CSS if tag == "*" else tag
         try:
-            element = self.wait_utils.wait_for_clickable(By.XPATH, xpath)
-            if element and move_to_element:
-                self.move_to_element(element)
+            element = self.wait_utils.until(
+                lambda driver: self._call_js(
+                    "findClickableByText", selector, text, exact_match, include_descendants
+                )
+            )
+            if move_to_element:
+                self.move_to_element(element, only_if_out_of_view=True)
             return element
         except TimeoutException:
-            logger.error(f"No clickable element found with text: {text}")
+            logger.error("No clickable element found with text: %s", text)
             raise
         except Exception as e:
-            logger.error(f"Error finding clickable element: {str(e)}")
+            logger.error("Error finding clickable element: %s", e)
             raise
 
     def get_clickable_elements_by_text(
-        self, text: str, exact_match: bool = False, move_to_element: bool = True
+        self,
+        text: str,
+        exact_match: bool = False,
+        move_to_element: bool = True,
+        tag: str = "*",
     ) -> List[WebElement]:
         """
         Finds all clickable elements matching the specified text.
@@ -539,21 +1657,56 @@ class SeleniumUtils:
         :param text: The text to search for.
         :param exact_match: If True, matches the text exactly.
         :param move_to_element: Whether to move to the element after finding it.
+        :param tag: CSS selector restricting the candidates (e.g., 'button', 'a, button');
+                    narrower selectors mean less of the DOM is scanned.
         :return: A list of matching clickable WebElements.
         """
-        xpath = (
-            f".//*[text()='{text}']"
-            if exact_match
-            else f".//*[contains(text(), '{text}')]"
-        )
-        elements = self.wait_utils.wait.until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
-        )
+        elements = self._wait_for_elements_with_text(tag, text, exact_match)
         if move_to_element:
-            for element in elements:
-                self.move_to_element(element)
+            self._bulk_move(elements)
         return elements
 
+    def iter_clickable_elements_by_text(
+        self,
+        text: str,
+        exact_match: bool = False,
+        move_to_element: bool = True,
+        tag: str = "*",
+    ) -> Iterator[WebElement]:
+        """
+        Lazy variant of get_clickable_elements_by_text: yields the matches one at a time,
+        moving to each only when it is consumed, so callers that stop early skip the rest.
+
+        :param text: The text to search for.
+        :param exact_match: If True, matches the text exactly.
+        :param move_to_element: Whether to move to each element before yielding it.
+        :param tag: CSS selector restricting the candidates (e.g., 'button').
+        :return: An iterator over the matching WebElements.
+        """
+        for element in self.get_clickable_elements_by_text(text, exact_match, False, tag):
+            if move_to_element:
+                self.move_to_element(element, only_if_out_of_view=True)
+            yield element
+
+    def _wait_for_elements_with_text(
+        self, selector: str, text: str, exact_match: bool = False
+    ) -> List[WebElement]:
+        """
+        Waits until at least one element matching the CSS selector has a text node
+        containing (or, for exact matches, equal to) the text. Each poll is a single
+        execute_script call using the browser's native querySelectorAll instead of a
+        full-document XPath walk.
+
+        :param selector: The CSS selector of the candidates (e.g., '*', 'button').
+        :param text: The text to search for.
+        :param exact_match: If True, a text node must equal the text.
+        :return: The matching WebElements.
+        """
+        return self.wait_utils.until(
+            lambda driver: self._call_js("collectByText", selector, text, exact_match)
+            or False
+        )
+
     def get_button_by_label(
         self, 
         label: str, 
@@ -574,71 +1727,54 @@ class SeleniumUtils:
         :param case_sensitive: Whether to match text case sensitively
         :return: The found button WebElement
         """
-        label_text = label if case_sensitive else label.lower()
-        
-        # Build xpath conditions for text matching
-        text_match = (
-            f"normalize-space()='{label_text}'"
-            if exact_match
-            else f"contains(normalize-space(),'{label_text}')"
-        )
-        
-        if not case_sensitive:
-            text_match = f"translate({text_match}, 'ABCDEFGHIJKLMNOPQRSTUVWXYZ', 'abcdefghijklmnopqrstuvwxyz')"
-
-        # Base button selectors
-        button_conditions = [
-            f".//button[{text_match}]",  # Standard buttons
-            f".//button[.//*[{text_match}]]",  # Buttons with nested elements
-        ]
-
-        # Add optional selectors
-        if include_spans:
-            button_conditions.extend([
-                f".//span[{text_match} and @role='button']",
-                f".//div[{text_match} and @role='button']",
-                f".//a[{text_match} and @role='button']"
-            ])
-
-        if include_inputs:
-            button_conditions.extend([
-                f".//input[@type='button' and {text_match}]",
-                f".//input[@type='submit' and {text_match}]",
-                f".//input[@value and {text_match} and (@type='button' or @type='submit')]"
-            ])
-
-        # Combine all conditions
-        xpath = f"({' | '.join(button_conditions)})"
+        css = _button_css(include_spans, include_inputs)
 
         try:
-            # Try to find clickable button
-            button = self.wait_utils.wait_for_clickable(By.XPATH, xpath)
-            if not button:
-                # If not found, try finding any matching element
-                button = self.wait_utils.wait_for_element(By.XPATH, xpath)
-
-            if button and move_to_element:
-                self.move_to_element(button)
+            # Try to find clickable button: each poll is one querySelectorAll walk over
+            # all candidate kinds instead of an XPath union of separate descendant walks
+            button = self.wait_utils.until(
+                lambda driver: self._call_js(
+                    "findButton", css, label, exact_match, case_sensitive
+                )
+                or False
+            )
+            if move_to_element:
+                self.move_to_element(button, only_if_out_of_view=True)
 
             return button
 
         except Exception as e:
-            logger.error(f"Failed to find button with label '{label}': {str(e)}")
-            # Try finding buttons in iframes before giving up
-            iframes = self.driver.find_elements(By.TAG_NAME, "iframe")
-            for iframe in iframes:
+            logger.error("Failed to find button with label '%s': %s", label, e)
+            # Frames are searched with the equivalent XPath, evaluated per frame document
+            xpath = _button_xpath(
+                label, exact_match, include_spans, include_inputs, case_sensitive
+            )
+            logger.debug("xpath used: %s", xpath)
+            # Try finding buttons in iframes before giving up: all same-origin frames are
+            # searched by one script, only cross-origin ones need a frame switch (and get
+            # a single lookup each instead of a full wait)
+            try:
+                button, unreadable_frames = self._call_js("findInFrames", xpath)
+            except WebDriverException:
+                logger.debug("In-page frame search failed", exc_info=True)
+                button, unreadable_frames = None, self.driver.find_elements(
+                    By.TAG_NAME, "iframe"
+                )
+            if button is not None:
+                return button
+            for iframe in unreadable_frames:
                 try:
                     self.driver.switch_to.frame(iframe)
-                    button = self.wait_utils.wait_for_clickable(By.XPATH, xpath)
-                    if button:
+                    button = self.wait_utils.probe(By.XPATH, xpath)
+                    if button is not None:
                         if move_to_element:
-                            self.move_to_element(button)
+                            self.move_to_element(button, only_if_out_of_view=True)
                         return button
-                except:
+                except WebDriverException:
                     continue
                 finally:
                     self.driver.switch_to.default_content()
-            
+
             raise NoSuchElementException(f"No button found with label: {label}")
 
     def get_buttons_by_label(
@@ -652,52 +1788,148 @@ class SeleniumUtils:
         :param move_to_element: Whether to move to the buttons after finding them.
         :return: A list of matching button WebElements.
         """
-        xpath = (
-            f".//button[normalize-space(text())='{label}']"
-            if exact_match
-            else f".//button[contains(text(), '{label}')]"
-        )
-        buttons = self.wait_utils.wait.until(
-            EC.presence_of_all_elements_located((By.XPATH, xpath))
-        )
+        if exact_match:
+            xpath = _buttons_xpath(label, exact_match)
+            buttons = self.wait_utils.until(
+                EC.presence_of_all_elements_located((By.XPATH, xpath))
+            )
+        else:
+            buttons = self._wait_for_elements_with_text("button", label)
         if move_to_element:
-            for button in buttons:
-                self.move_to_element(button)
+            self._bulk_move(buttons)
         return buttons
 
+    def iter_buttons_by_label(
+        self, label: str, exact_match: bool = False, move_to_element: bool = True
+    ) -> Iterator[WebElement]:
+        """
+        Lazy variant of get_buttons_by_label: yields the matches one at a time,
+        moving to each only when it is consumed, so callers that stop early skip the rest.
+
+        :param label: The label of the buttons to search for.
+        :param exact_match: If True, matches the label exactly.
+        :param move_to_element: Whether to move to each button before yielding it.
+        :return: An iterator over the matching button WebElements.
+        """
+        for button in self.get_buttons_by_label(label, exact_match, False):
+            if move_to_element:
+                self.move_to_element(button, only_if_out_of_view=True)
+            yield button
+
     def safe_click(self, element: WebElement, retry_count: int = 3) -> bool:
         """
         New convenience method for safely clicking elements with retries
         
         :param element: The element to click
-        :param retry_count: Number of retry attempts
+        :param retry_count: Number of attempts while the element is not usable yet (hidden
+                            or disabled), one poll_frequency apart
         :return: True if click successful, False otherwise
         """
-        for i in range(retry_count):
+        for attempt in range(retry_count):
+            if attempt:
+                time.sleep(self.wait_utils.poll_frequency)
             try:
-                if element.is_displayed() and element.is_enabled():
+                # Detached elements report as unusable (they have no client rects)
+                if self._element_state(element)[0]:
                     element.click()
                     return True
             except StaleElementReferenceException:
-                if i == retry_count - 1:
-                    logger.error("Element became stale")
-                    return False
-                continue
-            except Exception as e:
-                logger.error(f"Click failed: {str(e)}")
+                # A stale reference never becomes valid again, retrying it only costs
+                # more round-trips (and tracebacks)
+                logger.error("Element became stale")
+                return False
+            except Exception:
+                logger.exception("Click failed")
                 return False
         return False
 
     def wait_for_text(self, text: str, timeout: Optional[int] = None) -> bool:
         """
-        New convenience method to wait for text to appear anywhere on the page
+        New convenience method to wait for text to appear anywhere on the page.
+        Each poll returns a boolean from the page instead of transferring page_source.
         
         :param text: Text to wait for
         :param timeout: Optional custom timeout
         :return: True if text found, False if timeout
         """
         try:
-            wait = WebDriverWait(self.driver, timeout or self.wait_utils.wait._timeout)
-            return wait.until(lambda driver: text in driver.page_source)
+            return self.wait_utils.until(
+                lambda driver: self._call_js("pageHasText", text), timeout
+            )
         except TimeoutException:
-            return False
\ No newline at end of file
+            return False
+
+
+class SeleniumPool:
+    """
+    Runs independent flows (e.g. form fills of different records) concurrently, each
+    worker thread driving its own WebDriver session through its own SeleniumUtils.
+    Commands are network-bound, so N sessions give close to N times the throughput until
+    the browser host or Grid saturates. On a Grid, size num_workers to its free slots,
+    queued session requests otherwise just wait on the hub.
+
+    Usage:
+        with SeleniumPool(4, lambda: init_driver(url, headless=True)) as pool:
+            pool.map(lambda utils, row: utils.bulk_fill(row), rows)
+    """
+
+    def __init__(
+        self,
+        num_workers: int,
+        driver_factory: Callable[[], WebDriver],
+        timeout: int = 10,
+    ) -> None:
+        """
+        :param num_workers: Number of worker threads, hence of browser sessions.
+        :param driver_factory: Creates a new session, called once per worker thread.
+        :param timeout: The SeleniumUtils wait timeout of each session (in seconds).
+        """
+        if num_workers < 1:
+            raise ValueError("num_workers must be at least 1")
+        self.driver_factory = driver_factory
+        self.timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=num_workers)
+        self._local = threading.local()
+        self._sessions: List[SeleniumUtils] = []
+        self._lock = threading.Lock()
+
+    def _utils(self) -> SeleniumUtils:
+        """Returns the current thread's SeleniumUtils, starting its session on first use."""
+        utils = getattr(self._local, "utils", None)
+        if utils is None:
+            utils = self._local.utils = SeleniumUtils(self.driver_factory(), self.timeout)
+            with self._lock:
+                self._sessions.append(utils)
+        return utils
+
+    @contextlib.contextmanager
+    def session(self) -> Iterator[SeleniumUtils]:
+        """Yields the calling thread's SeleniumUtils (and session)."""
+        yield self._utils()
+
+    def map(self, fn: Callable[[SeleniumUtils, Any], Any], items: Iterable[Any]) -> List[Any]:
+        """
+        Calls fn(utils, item) for every item on the worker threads.
+
+        :param fn: The flow to run, given the worker's SeleniumUtils and one item.
+        :param items: The independent inputs.
+        :return: The results, in the order of `items` (the first exception is re-raised).
+        """
+        return list(self._executor.map(lambda item: fn(self._utils(), item), items))
+
+    def close(self) -> None:
+        """Waits for the running flows, then quits every session the pool started."""
+        self._executor.shutdown(wait=True)
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for utils in sessions:
+            try:
+                utils.driver.quit()
+            except WebDriverException:
+                logger.debug("Failed to quit a pooled session", exc_info=True)
+
+    def __enter__(self) -> "SeleniumPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
@@ -11,12 +11,14 @@ import time
 import os
 import csv
 
-from selenium_initializer import save_json, init_driver
-from selenium_utils import SeleniumUtils
+from seleniumplusplus.selenium_initializer import save_json, init_driver
+from seleniumplusplus.selenium_utils import SeleniumPool, SeleniumUtils
 
+URL = "http://127.0.0.1:5500/seleniumplusplus/tests/page/index.html"
+NUM_WORKERS = 2
 
-def site_test_1():
-    global driver
+
+def site_test_1(su: SeleniumUtils):
     try:
         element = su.get_button_by_label("Click me")
         print(element.accessible_name, element.is_displayed, element.id)
@@ -45,16 +47,21 @@ def site_test_1():
     return element
  """
 
+TESTS = [site_test_1]
+
+
+def run_test(su: SeleniumUtils, test) -> None:
+    # Sessions are reused across tests, start each one from a clean page
+    su.driver.delete_all_cookies()
+    su.navigate(URL)
+    test(su)
+
+
 # Main function
 def main() -> None:
-    global driver
-    global su
-    driver = init_driver(url="http://127.0.0.1:5500/seleniumplusplus/tests/page/index.html")
-    su = SeleniumUtils(driver)
-    # Do stuff here
-    site_test_1()
-
-    driver.quit()
+    # Every worker keeps its own browser for all the tests it runs
+    with SeleniumPool(NUM_WORKERS, lambda: init_driver(url=URL)) as pool:
+        pool.map(run_test, TESTS)
 
 
 if __name__ == "__main__":